@@ -0,0 +1,114 @@
+"""
+Disk Cache Module
+
+This module persists Steam API results between runs so that repeated
+invocations within a short time window can skip the network entirely.
+"""
+
+import os
+import json
+import time
+from typing import Any, Callable, Optional
+
+
+CACHE_DIR = os.path.expandvars(r'%LOCALAPPDATA%\steam-hours-tool\cache')
+
+# Time-to-live for each kind of cached result, in seconds
+PLAYER_SUMMARY_TTL = 30 * 60      # 30 minutes
+OWNED_GAMES_TTL = 6 * 60 * 60     # 6 hours
+RECENT_GAMES_TTL = 30 * 60        # 30 minutes
+
+
+def _cache_path(key: str) -> str:
+    """Return the cache file path for a key."""
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_cached(key: str, ttl: float) -> Optional[Any]:
+    """
+    Load a cached value if it exists and is younger than the TTL.
+    
+    Args:
+        key: Cache key (used as the file name)
+        ttl: Maximum age of the cached value in seconds
+    
+    Returns:
+        The cached JSON data, or None if missing, expired or unreadable
+    """
+    try:
+        with open(_cache_path(key), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(entry, dict):
+        return None
+    
+    # A hand-edited or corrupt entry may carry a non-numeric timestamp;
+    # treat it as a miss so the value is refetched
+    saved_at = entry.get('saved_at')
+    if not isinstance(saved_at, (int, float)) or time.time() - saved_at > ttl:
+        return None
+    
+    return entry.get('data')
+
+
+def store_cached(key: str, data: Any):
+    """
+    Store a JSON-serializable value in the cache.
+    
+    Failures are ignored: the cache is an optimization, not a requirement.
+    
+    Args:
+        key: Cache key (used as the file name)
+        data: JSON-serializable value to store
+    """
+    path = _cache_path(key)
+    tmp_path = f"{path}.tmp"
+    try:
+        payload = json.dumps({'saved_at': time.time(), 'data': data})
+    except (TypeError, ValueError):
+        return
+    
+    # Write to a temporary file first so readers never see a partial entry
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def cached(key: str, ttl: float, fetch: Callable[[], Any], refresh: bool = False,
+           encode: Optional[Callable[[Any], Any]] = None,
+           decode: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Return a cached value, calling fetch() and caching its result on a miss.
+    
+    Args:
+        key: Cache key (used as the file name)
+        ttl: Maximum age of a cached value in seconds
+        fetch: Callable producing the fresh value
+        refresh: Ignore any cached value and fetch again
+        encode: Converts the fetched value to JSON-serializable data (optional)
+        decode: Converts cached JSON data back to the fetched form (optional)
+    
+    Returns:
+        The cached or freshly fetched value
+    """
+    if not refresh:
+        data = load_cached(key, ttl)
+        if data is not None:
+            if not decode:
+                return data
+            try:
+                return decode(data)
+            except (TypeError, ValueError, KeyError):
+                pass  # Stale or corrupt entry: fall through and refetch
+    
+    value = fetch()
+    # Empty results usually mean a private profile; don't pin them in the cache
+    if value:
+        store_cached(key, encode(value) if encode else value)
+    return value
@@ -7,14 +7,51 @@ input validation, and formatted console output.
 
 import sys
 from typing import List, Optional
-from colorama import init, Fore, Back, Style
 from vdf_parser import SteamAccount
 
-# Initialize colorama for Windows console color support
-init(autoreset=True)
 
+class _NoColor:
+    """Stand-in for colorama's Fore/Back/Style that yields empty codes."""
+    
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+
+if sys.stdout is not None and sys.stdout.isatty():
+    from colorama import just_fix_windows_console, Fore, Back, Style
+    
+    # Enables native ANSI handling on Windows 10+ and only wraps stdout on
+    # legacy consoles; every coloured line ends with an explicit reset, so
+    # autoreset isn't needed
+    just_fix_windows_console()
+else:
+    # Output is redirected to a file or pipe: skip colorama and its stdout
+    # wrapper entirely and emit plain text
+    Fore = Back = Style = _NoColor()
+
+# Escape sequences and decorations are fixed for the life of the process,
+# so build them once instead of on every print call
+_BOLD = Style.BRIGHT
+_RESET = Style.RESET_ALL
+_LABEL = Fore.WHITE
+_BLUE = Fore.BLUE
+_CYAN = Fore.CYAN
+_GREEN = Fore.GREEN
+_RED = Fore.RED
+_YELLOW = Fore.YELLOW
+_CYAN_BOLD = Fore.CYAN + Style.BRIGHT
+_GREEN_BOLD = Fore.GREEN + Style.BRIGHT
+_MAGENTA_BOLD = Fore.MAGENTA + Style.BRIGHT
+_RED_BOLD = Fore.RED + Style.BRIGHT
+_YELLOW_BOLD = Fore.YELLOW + Style.BRIGHT
+_BANNER = Back.BLUE + Fore.WHITE + Style.BRIGHT
 
-def select_account(accounts: List[SteamAccount], account_index: Optional[int] = None) -> SteamAccount:
+_SEP = "─" * 50
+_SEP_DOUBLE = "=" * 50
+_TOP3_FMT = "  {medal} " + _LABEL + "{name}: " + _BOLD + "{hours}" + _RESET
+
+
+def select_account(accounts: List[SteamAccount], account_index: Optional[int] = None) -> Optional[SteamAccount]:
     """
     Allow user to select a Steam account from the available options.
     
@@ -23,74 +60,79 @@ def select_account(accounts: List[SteamAccount], account_index: Optional[int] =
         account_index: Pre-selected account index (1-based), or None for interactive selection
         
     Returns:
-        Selected SteamAccount object
-        
-    Raises:
-        SystemExit: If invalid account index is provided or user cancels
+        Selected SteamAccount object, or None if no accounts are available,
+        an invalid account index is provided or the user cancels
     """
     if not accounts:
         print("❌ No Steam accounts found.")
-        sys.exit(1)
+        return None
     
     # If only one account, use it automatically
     if len(accounts) == 1:
-        print(f"✅ Using Steam account: {Style.BRIGHT}{accounts[0]}")
+        print(f"✅ Using Steam account: {_BOLD}{accounts[0]}{_RESET}")
         return accounts[0]
     
     # If account index is pre-specified, validate and use it
     if account_index is not None:
         if 1 <= account_index <= len(accounts):
             selected = accounts[account_index - 1]
-            print(f"✅ Using Steam account: {Style.BRIGHT}{selected}")
+            print(f"✅ Using Steam account: {_BOLD}{selected}{_RESET}")
             return selected
         else:
             print(f"❌ Error: Invalid account index {account_index}. Valid range: 1-{len(accounts)}")
-            sys.exit(1)
+            return None
     
     # Interactive account selection
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}🎮 Steam Account Selection")
-    print("=" * 50)
+    print(f"\n{_CYAN_BOLD}🎮 Steam Account Selection{_RESET}")
+    print(_SEP_DOUBLE)
     print(f"Found {len(accounts)} Steam account(s):")
     print()
     
     for i, account in enumerate(accounts, 1):
         # Highlight the most recent account
         if account.most_recent:
-            print(f"  {Fore.GREEN}{Style.BRIGHT}[{i}] {account}{Style.RESET_ALL}")
+            print(f"  {_GREEN_BOLD}[{i}] {account}{_RESET}")
         else:
-            print(f"  {Fore.WHITE}[{i}] {account}")
+            print(f"  {_LABEL}[{i}] {account}{_RESET}")
     
     print()
-    print(f"{Fore.YELLOW}💡 Press ENTER to select the most recent account")
-    print(f"{Fore.WHITE}Or enter a number (1-{len(accounts)}) to choose a specific account")
-    print("─" * 50)
+    print(f"{_YELLOW}💡 Press ENTER to select the most recent account{_RESET}")
+    print(f"{_LABEL}Or enter a number (1-{len(accounts)}) to choose a specific account{_RESET}")
+    print(_SEP)
     
     while True:
         try:
-            user_input = input(f"{Fore.CYAN}Select account: {Style.RESET_ALL}").strip()
+            sys.stdout.write(f"{_CYAN}Select account: {_RESET}")
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                # EOF (e.g. exhausted piped input): finish the prompt line and
+                # fall back to the most recent account below
+                sys.stdout.write("\n")
+            user_input = line.strip()
             
-            # Empty input = select most recent account
+            # Empty input or EOF = select most recent account
             if not user_input:
                 most_recent_account = next((acc for acc in accounts if acc.most_recent), accounts[0])
-                print(f"✅ Selected: {Style.BRIGHT}{most_recent_account}")
+                print(f"✅ Selected: {_BOLD}{most_recent_account}{_RESET}")
                 return most_recent_account
             
             # Parse numeric input
             choice = int(user_input)
             if 1 <= choice <= len(accounts):
                 selected = accounts[choice - 1]
-                print(f"✅ Selected: {Style.BRIGHT}{selected}")
+                print(f"✅ Selected: {_BOLD}{selected}{_RESET}")
                 return selected
             else:
-                print(f"{Fore.RED}❌ Invalid choice. Please enter a number between 1 and {len(accounts)}")
+                print(f"{_RED}❌ Invalid choice. Please enter a number between 1 and {len(accounts)}{_RESET}")
                 continue
                 
         except ValueError:
-            print(f"{Fore.RED}❌ Invalid input. Please enter a number or press ENTER")
+            print(f"{_RED}❌ Invalid input. Please enter a number or press ENTER{_RESET}")
             continue
         except KeyboardInterrupt:
-            print(f"\n{Fore.YELLOW}Cancelled by user.")
-            sys.exit(0)
+            print(f"\n{_YELLOW}Cancelled by user.{_RESET}")
+            return None
 
 
 def format_hours(minutes: int) -> str:
@@ -103,14 +145,9 @@ def format_hours(minutes: int) -> str:
     Returns:
         Formatted time string (e.g., "123.4 hours")
     """
-    if minutes == 0:
-        return "0.0 hours"
-    
-    hours = minutes / 60
-    if hours >= 1000:
-        return f"{hours:,.1f} hours"
-    else:
-        return f"{hours:.1f} hours"
+    # The thousands separator only kicks in from 1,000 hours, so a single
+    # format spec covers both small and large values
+    return f"{minutes / 60:,.1f} hours"
 
 
 def print_banner(account: SteamAccount):
@@ -120,62 +157,82 @@ def print_banner(account: SteamAccount):
     Args:
         account: Selected Steam account
     """
-    print(f"\n{Back.BLUE}{Fore.WHITE}{Style.BRIGHT}")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 25 + "STEAM HOURS ANALYZER" + " " * 23 + "║")
-    print("╚" + "═" * 68 + "╝")
-    print(f"{Style.RESET_ALL}")
-    
-    print(f"{Fore.CYAN}{Style.BRIGHT}📊 Account Analysis")
-    print("─" * 50)
-    print(f"{Fore.WHITE}Player: {Style.BRIGHT}{account.persona_name}")
-    print(f"{Fore.WHITE}Account: {account.account_name}")
-    print(f"{Fore.WHITE}Steam ID: {account.steam_id}")
-    print()
+    # Build the whole block and write it once. Coloured lines end with an
+    # explicit reset, as everywhere else in this module.
+    parts = [
+        "",
+        _BANNER,
+        "╔" + "═" * 68 + "╗",
+        "║" + " " * 25 + "STEAM HOURS ANALYZER" + " " * 23 + "║",
+        "╚" + "═" * 68 + "╝",
+        _RESET,
+        f"{_CYAN_BOLD}📊 Account Analysis{_RESET}",
+        _SEP,
+        f"{_LABEL}Player: {_BOLD}{account.persona_name}{_RESET}",
+        f"{_LABEL}Account: {account.account_name}{_RESET}",
+        f"{_LABEL}Steam ID: {account.steam_id}{_RESET}",
+        "",
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+def _append_top3(parts: List[str], top: List[tuple]):
+    """
+    Append medal rows for up to three (game_name, minutes) tuples.
+    
+    Args:
+        parts: Output lines to append to
+        top: Non-empty list of (game_name, minutes) tuples, best first
+    """
+    # The layout is fixed at three rows, so emit them straight-line
+    count = len(top)
+    parts.append(_TOP3_FMT.format(medal="🥇", name=top[0][0], hours=format_hours(top[0][1])))
+    if count > 1:
+        parts.append(_TOP3_FMT.format(medal="🥈", name=top[1][0], hours=format_hours(top[1][1])))
+    if count > 2:
+        parts.append(_TOP3_FMT.format(medal="🥉", name=top[2][0], hours=format_hours(top[2][1])))
 
 
-def print_statistics(total_hours: float, total_games: int, 
+def print_statistics(total_minutes: int, total_games: int, 
                     top_alltime: List[tuple], top_recent: List[tuple]):
     """
     Print formatted playtime statistics.
     
     Args:
-        total_hours: Total hours played across all games
+        total_minutes: Total minutes played across all games
         total_games: Total number of games in library
-        top_alltime: List of (game_name, hours) tuples for all-time top games
-        top_recent: List of (game_name, hours) tuples for recent top games
+        top_alltime: List of (game_name, minutes) tuples for all-time top games
+        top_recent: List of (game_name, minutes) tuples for recent top games
     """
     # Overall statistics
-    print(f"{Fore.GREEN}{Style.BRIGHT}📈 Overall Statistics")
-    print("─" * 50)
-    print(f"{Fore.WHITE}Total Games in Library: {Style.BRIGHT}{total_games:,}")
-    print(f"{Fore.WHITE}Total Hours Played: {Style.BRIGHT}{total_hours:,.1f} hours")
-    print()
+    parts = [
+        f"{_GREEN_BOLD}📈 Overall Statistics{_RESET}",
+        _SEP,
+        f"{_LABEL}Total Games in Library: {_BOLD}{total_games:,}{_RESET}",
+        f"{_LABEL}Total Hours Played: {_BOLD}{format_hours(total_minutes)}{_RESET}",
+        "",
+    ]
     
     # Top games all-time
     if top_alltime:
-        print(f"{Fore.MAGENTA}{Style.BRIGHT}🏆 Top 3 Games (All-Time)")
-        print("─" * 50)
-        for i, (game_name, hours) in enumerate(top_alltime, 1):
-            medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else "🔹"
-            hours_str = format_hours(int(hours * 60))  # Convert back to minutes for formatting
-            print(f"  {medal} {Fore.WHITE}{game_name}: {Style.BRIGHT}{hours_str}")
-        print()
+        parts.append(f"{_MAGENTA_BOLD}🏆 Top 3 Games (All-Time){_RESET}")
+        parts.append(_SEP)
+        _append_top3(parts, top_alltime)
+        parts.append("")
     
     # Top games recent (2 weeks)
     if top_recent:
-        print(f"{Fore.YELLOW}{Style.BRIGHT}⚡ Top 3 Games (Past 2 Weeks)")
-        print("─" * 50)
-        for i, (game_name, hours) in enumerate(top_recent, 1):
-            medal = ["🥇", "🥈", "🥉"][i-1] if i <= 3 else "🔹"
-            hours_str = format_hours(int(hours * 60))  # Convert back to minutes for formatting
-            print(f"  {medal} {Fore.WHITE}{game_name}: {Style.BRIGHT}{hours_str}")
-        print()
+        parts.append(f"{_YELLOW_BOLD}⚡ Top 3 Games (Past 2 Weeks){_RESET}")
+        parts.append(_SEP)
+        _append_top3(parts, top_recent)
+        parts.append("")
     else:
-        print(f"{Fore.YELLOW}{Style.BRIGHT}⚡ Recent Activity (Past 2 Weeks)")
-        print("─" * 50)
-        print(f"  {Fore.WHITE}No games played in the past 2 weeks")
-        print()
+        parts.append(f"{_YELLOW_BOLD}⚡ Recent Activity (Past 2 Weeks){_RESET}")
+        parts.append(_SEP)
+        parts.append(f"  {_LABEL}No games played in the past 2 weeks{_RESET}")
+        parts.append("")
+    
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
 def print_error(message: str):
@@ -185,7 +242,7 @@ def print_error(message: str):
     Args:
         message: Error message to display
     """
-    print(f"\n{Fore.RED}{Style.BRIGHT}❌ Error: {message}")
+    print(f"\n{_RED_BOLD}❌ Error: {message}{_RESET}")
 
 
 def print_warning(message: str):
@@ -195,7 +252,7 @@ def print_warning(message: str):
     Args:
         message: Warning message to display
     """
-    print(f"{Fore.YELLOW}⚠️  Warning: {message}")
+    print(f"{_YELLOW}⚠️  Warning: {message}{_RESET}")
 
 
 def print_success(message: str):
@@ -205,7 +262,7 @@ def print_success(message: str):
     Args:
         message: Success message to display
     """
-    print(f"{Fore.GREEN}✅ {message}")
+    print(f"{_GREEN}✅ {message}{_RESET}")
 
 
 def print_info(message: str):
@@ -215,7 +272,7 @@ def print_info(message: str):
     Args:
         message: Info message to display
     """
-    print(f"{Fore.CYAN}ℹ️  {message}")
+    print(f"{_CYAN}ℹ️  {message}{_RESET}")
 
 
 def show_loading_indicator(message: str):
@@ -225,31 +282,28 @@ def show_loading_indicator(message: str):
     Args:
         message: Message to display while loading
     """
-    print(f"{Fore.BLUE}⏳ {message}...")
+    print(f"{_BLUE}⏳ {message}...{_RESET}")
 
 
 if __name__ == "__main__":
     # Test the CLI module
     from vdf_parser import get_steam_accounts
     
-    try:
-        accounts = get_steam_accounts()
-        selected = select_account(accounts)
+    accounts = get_steam_accounts()
+    selected = select_account(accounts) if accounts else None
+    if selected:
         print_banner(selected)
         
         # Test statistics display with dummy data
         dummy_top_alltime = [
-            ("Counter-Strike 2", 845.2),
-            ("Dota 2", 623.7),
-            ("Team Fortress 2", 234.1)
+            ("Counter-Strike 2", 50712),
+            ("Dota 2", 37422),
+            ("Team Fortress 2", 14046)
         ]
         dummy_top_recent = [
-            ("Baldur's Gate 3", 28.5),
-            ("Cyberpunk 2077", 12.3),
-            ("Elden Ring", 8.7)
+            ("Baldur's Gate 3", 1710),
+            ("Cyberpunk 2077", 738),
+            ("Elden Ring", 522)
         ]
         
-        print_statistics(1703.0, 156, dummy_top_alltime, dummy_top_recent)
-        
-    except SystemExit:
-        pass
\ No newline at end of file
+        print_statistics(102180, 156, dummy_top_alltime, dummy_top_recent)
\ No newline at end of file
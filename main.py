@@ -9,13 +9,19 @@ Author: Steam Hours Tool
 Version: 1.0.0
 """
 
+import os
 import sys
 import argparse
-from typing import Optional
+from dataclasses import asdict
+from typing import Optional, List, Dict, Any
 
 # Import our custom modules
-from vdf_parser import get_steam_accounts, SteamAccount
-from steam_api import get_api_key, SteamAPIClient, SteamAPIError
+from vdf_parser import get_steam_accounts, find_loginusers_vdf, SteamAccount
+from steam_api import get_api_key, SteamAPIClient, SteamAPIError, GameData
+from cache import (
+    cached, load_cached, store_cached,
+    PLAYER_SUMMARY_TTL, OWNED_GAMES_TTL, RECENT_GAMES_TTL
+)
 from stats import process_playtime_statistics, merge_owned_and_recent_data
 from cli import (
     select_account, print_banner, print_statistics, print_error, 
@@ -32,6 +38,7 @@ def parse_arguments():
 Examples:
   python main.py                    # Interactive mode
   python main.py --account 1        # Use first account (non-interactive)
+  python main.py --refresh          # Ignore cached Steam API results
   STEAM_API_KEY=xyz python main.py  # Use environment variable for API key
   
 Account numbers correspond to the order shown when running interactively.
@@ -46,6 +53,12 @@ The most recent account is usually #1.
         help='Select account by number (1-based index, skips interactive selection)'
     )
     
+    parser.add_argument(
+        '--refresh', '-r',
+        action='store_true',
+        help='Bypass cached Steam API results and fetch fresh data'
+    )
+    
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -55,6 +68,69 @@ The most recent account is usually #1.
     return parser.parse_args()
 
 
+def games_to_json(games: List[GameData]) -> List[Dict[str, Any]]:
+    """Convert GameData objects to JSON-serializable dicts for caching."""
+    return [asdict(game) for game in games]
+
+
+def games_from_json(rows: List[Dict[str, Any]]) -> List[GameData]:
+    """Rebuild GameData objects from cached dicts."""
+    return [GameData(**row) for row in rows]
+
+
+def accounts_to_json(accounts: List[SteamAccount]) -> List[Dict[str, Any]]:
+    """Convert SteamAccount objects to JSON-serializable dicts for caching."""
+    return [
+        {
+            'steam_id': account.steam_id,
+            'account_name': account.account_name,
+            'persona_name': account.persona_name,
+            'most_recent': account.most_recent,
+            'timestamp': account.timestamp
+        }
+        for account in accounts
+    ]
+
+
+def accounts_from_json(rows: List[Dict[str, Any]]) -> List[SteamAccount]:
+    """Rebuild SteamAccount objects from cached dicts."""
+    return [SteamAccount(**row) for row in rows]
+
+
+def get_steam_accounts_cached() -> Optional[List[SteamAccount]]:
+    """
+    Get all Steam accounts, reusing the previous parse while loginusers.vdf
+    is unchanged.
+    
+    The cached accounts are keyed by the VDF file's path, modification time
+    and size, so any write by Steam invalidates them.
+    
+    Returns:
+        List of SteamAccount objects, or None if no accounts could be loaded
+    """
+    signature = None
+    vdf_path = find_loginusers_vdf()
+    if vdf_path:
+        try:
+            stat = os.stat(vdf_path)
+            signature = [vdf_path, stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            pass
+    
+    if signature:
+        entry = load_cached("accounts", float('inf'))
+        if isinstance(entry, dict) and entry.get('signature') == signature:
+            try:
+                return accounts_from_json(entry['accounts'])
+            except (TypeError, ValueError, KeyError):
+                pass  # Corrupt entry: fall through and reparse
+    
+    accounts = get_steam_accounts()
+    if accounts and signature:
+        store_cached("accounts", {'signature': signature, 'accounts': accounts_to_json(accounts)})
+    return accounts
+
+
 def main():
     """Main application entry point."""
     try:
@@ -63,22 +139,19 @@ def main():
         
         # Step 1: Get available Steam accounts
         print_info("Scanning for Steam accounts...")
-        try:
-            accounts = get_steam_accounts()
-        except SystemExit:
+        accounts = get_steam_accounts_cached()
+        if accounts is None:
             return 1
         
         # Step 2: Select Steam account
-        try:
-            selected_account = select_account(accounts, args.account)
-        except SystemExit:
+        selected_account = select_account(accounts, args.account)
+        if selected_account is None:
             return 1
         
         # Step 3: Get Steam Web API key
         print_info("Setting up Steam Web API access...")
-        try:
-            api_key = get_api_key()
-        except SystemExit:
+        api_key = get_api_key()
+        if api_key is None:
             return 1
         
         # Step 4: Initialize Steam API client
@@ -88,83 +161,106 @@ def main():
             print_error(f"Failed to initialize Steam API client: {e}")
             return 1
         
-        # Display banner
-        print_banner(selected_account)
-        
-        # Step 5: Fetch player summary (for verification)
-        show_loading_indicator("Verifying account access")
-        try:
-            player_summary = client.get_player_summary(selected_account.steam_id)
-            verified_name = player_summary.get('personaname', 'Unknown')
+        # Close the client's pooled connections however the analysis ends
+        with client:
+            # Display banner
+            print_banner(selected_account)
+            steam_id = selected_account.steam_id
             
-            if verified_name != selected_account.persona_name:
-                print_warning(f"Steam profile name has changed: '{selected_account.persona_name}' → '{verified_name}'")
+            # Step 5: Fetch player summary (for verification)
+            show_loading_indicator("Verifying account access")
+            try:
+                player_summary = cached(
+                    f"{steam_id}-summary", PLAYER_SUMMARY_TTL,
+                    lambda: client.get_player_summary(steam_id),
+                    refresh=args.refresh
+                )
+                verified_name = player_summary.get('personaname', 'Unknown')
+                
+                if verified_name != selected_account.persona_name:
+                    print_warning(f"Steam profile name has changed: '{selected_account.persona_name}' → '{verified_name}'")
+                
+            except SteamAPIError as e:
+                print_error(f"Failed to verify account: {e}")
+                print_info("This might indicate a private profile or invalid API key")
+                return 1
             
-        except SteamAPIError as e:
-            print_error(f"Failed to verify account: {e}")
-            print_info("This might indicate a private profile or invalid API key")
-            return 1
-        
-        # Step 6: Fetch owned games
-        show_loading_indicator("Fetching game library")
-        try:
-            owned_games = client.get_owned_games(selected_account.steam_id)
-            if not owned_games:
-                print_warning("No games found in library. This might indicate a private profile.")
-                return 0
+            # Steps 6-7 query independent endpoints, so start both requests now
+            # and let their round trips overlap; results are consumed in order
+            owned_call, recent_call = client.start_games_fetch(
+                steam_id,
+                fetch_owned=lambda: cached(
+                    f"{steam_id}-owned", OWNED_GAMES_TTL,
+                    lambda: client.get_owned_games(steam_id),
+                    refresh=args.refresh, encode=games_to_json, decode=games_from_json
+                ),
+                fetch_recent=lambda: cached(
+                    f"{steam_id}-recent", RECENT_GAMES_TTL,
+                    lambda: client.get_recently_played_games(steam_id),
+                    refresh=args.refresh, encode=games_to_json, decode=games_from_json
+                )
+            )
             
-            print_success(f"Found {len(owned_games)} games in library")
+            # Step 6: Fetch owned games
+            show_loading_indicator("Fetching game library")
+            try:
+                owned_games = owned_call.result()
+                if not owned_games:
+                    print_warning("No games found in library. This might indicate a private profile.")
+                    return 0
+                
+                print_success(f"Found {len(owned_games)} games in library")
+                
+            except SteamAPIError as e:
+                print_error(f"Failed to fetch game library: {e}")
+                return 1
             
-        except SteamAPIError as e:
-            print_error(f"Failed to fetch game library: {e}")
-            return 1
-        
-        # Step 7: Fetch recently played games
-        show_loading_indicator("Fetching recent activity")
-        try:
-            recent_games = client.get_recently_played_games(selected_account.steam_id)
-            recent_count = len(recent_games)
+            # Step 7: Fetch recently played games
+            show_loading_indicator("Fetching recent activity")
+            try:
+                recent_games = recent_call.result()
+                recent_count = len(recent_games)
+                
+                if recent_count > 0:
+                    print_info(f"Found {recent_count} recently played games (past 2 weeks)")
+                else:
+                    print_info("No recent activity found (past 2 weeks)")
+                
+            except SteamAPIError as e:
+                print_warning(f"Failed to fetch recent activity: {e}")
+                recent_games = []  # Continue without recent data
             
-            if recent_count > 0:
-                print_info(f"Found {recent_count} recently played games (past 2 weeks)")
-            else:
-                print_info("No recent activity found (past 2 weeks)")
+            # Step 8: Merge game data and process statistics
+            show_loading_indicator("Processing statistics")
+            try:
+                # Merge owned games with recent games for complete data
+                merged_games = merge_owned_and_recent_data(owned_games, recent_games)
+                
+                # Process playtime statistics
+                stats = process_playtime_statistics(merged_games)
+                
+                print_success("Statistics processed successfully")
+                
+            except Exception as e:
+                print_error(f"Failed to process statistics: {e}")
+                return 1
             
-        except SteamAPIError as e:
-            print_warning(f"Failed to fetch recent activity: {e}")
-            recent_games = []  # Continue without recent data
-        
-        # Step 8: Merge game data and process statistics
-        show_loading_indicator("Processing statistics")
-        try:
-            # Merge owned games with recent games for complete data
-            merged_games = merge_owned_and_recent_data(owned_games, recent_games)
+            # Step 9: Display results
+            print_statistics(
+                total_minutes=stats.total_minutes,
+                total_games=stats.total_games,
+                top_alltime=stats.top_alltime,
+                top_recent=stats.top_recent
+            )
             
-            # Process playtime statistics
-            stats = process_playtime_statistics(merged_games)
+            # Additional info if no playtime found
+            if stats.total_minutes == 0:
+                print_info("No playtime data found. This might indicate:")
+                print("  • Private Steam profile")
+                print("  • No games have been played")
+                print("  • API access restrictions")
             
-            print_success("Statistics processed successfully")
-            
-        except Exception as e:
-            print_error(f"Failed to process statistics: {e}")
-            return 1
-        
-        # Step 9: Display results
-        print_statistics(
-            total_hours=stats.total_hours,
-            total_games=stats.total_games,
-            top_alltime=stats.top_alltime,
-            top_recent=stats.top_recent
-        )
-        
-        # Additional info if no playtime found
-        if stats.total_hours == 0:
-            print_info("No playtime data found. This might indicate:")
-            print("  • Private Steam profile")
-            print("  • No games have been played")
-            print("  • API access restrictions")
-        
-        return 0
+            return 0
         
     except KeyboardInterrupt:
         print_info("\nOperation cancelled by user")
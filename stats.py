@@ -5,19 +5,27 @@ This module handles processing of Steam game data to generate playtime statistic
 rankings, and aggregated metrics.
 """
 
-from typing import List, Tuple, Dict, Any
-from dataclasses import dataclass
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import List, Tuple, Dict, Any, Optional
+from dataclasses import dataclass, replace
+from operator import attrgetter
 from steam_api import GameData
 
+_by_playtime_forever = attrgetter('playtime_forever')
+_by_playtime_2weeks = attrgetter('playtime_2weeks')
+
 
 @dataclass
 class PlaytimeStatistics:
     """Container for processed playtime statistics."""
     total_hours: float
+    total_minutes: int
     total_games: int
     games_with_playtime: int
-    top_alltime: List[Tuple[str, float]]  # (game_name, hours)
-    top_recent: List[Tuple[str, float]]   # (game_name, hours)
+    top_alltime: List[Tuple[str, int]]  # (game_name, minutes)
+    top_recent: List[Tuple[str, int]]   # (game_name, minutes)
     raw_games_data: List[GameData]
 
 
@@ -34,6 +42,70 @@ def minutes_to_hours(minutes: int) -> float:
     return round(minutes / 60.0, 1)
 
 
+class GameLibrary:
+    """
+    Column-oriented view of a game library for whole-library analytics.
+    
+    The appid, name and playtime fields of GameData are stored as parallel
+    columns, with the integer fields in compact typed arrays, so totals and
+    rankings scan machine integers instead of looking up attributes on
+    thousands of objects. Image URLs are not kept.
+    """
+    
+    def __init__(self, appids: array, names: List[str],
+                 playtime_forever: array, playtime_2weeks: array):
+        self.appid = appids
+        self.name = names
+        self.playtime_forever = playtime_forever  # in minutes
+        self.playtime_2weeks = playtime_2weeks  # in minutes
+    
+    @classmethod
+    def from_games(cls, games: List[GameData]) -> 'GameLibrary':
+        """
+        Build a library from GameData objects.
+        
+        This is an opt-in view: get_owned_games and the statistics functions
+        keep working on GameData lists, and callers that run several passes
+        over a large library can build one of these from them.
+        
+        Args:
+            games: List of GameData objects
+            
+        Returns:
+            GameLibrary holding the same games in the same order
+        """
+        return cls(
+            array('q', [game.appid for game in games]),
+            [game.name for game in games],
+            array('q', [game.playtime_forever for game in games]),
+            array('q', [game.playtime_2weeks for game in games])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.appid)
+    
+    def total_hours(self) -> float:
+        """Return the total all-time playtime in hours, rounded to 1 decimal place."""
+        return minutes_to_hours(sum(self.playtime_forever))
+    
+    def top_n(self, n: int) -> List[int]:
+        """
+        Return the indices of the n most played games by all-time playtime.
+        
+        As in process_playtime_statistics, unplayed games are never ranked
+        and ties keep library order.
+        
+        Args:
+            n: Number of games to return
+            
+        Returns:
+            List of indices into the columns, most played first
+        """
+        playtime = self.playtime_forever
+        played = [i for i, minutes in enumerate(playtime) if minutes > 0]
+        return heapq.nlargest(n, played, key=playtime.__getitem__)
+
+
 def process_playtime_statistics(games: List[GameData]) -> PlaytimeStatistics:
     """
     Process game data to generate comprehensive playtime statistics.
@@ -47,6 +119,7 @@ def process_playtime_statistics(games: List[GameData]) -> PlaytimeStatistics:
     if not games:
         return PlaytimeStatistics(
             total_hours=0.0,
+            total_minutes=0,
             total_games=0,
             games_with_playtime=0,
             top_alltime=[],
@@ -54,25 +127,25 @@ def process_playtime_statistics(games: List[GameData]) -> PlaytimeStatistics:
             raw_games_data=[]
         )
     
-    # Calculate total playtime
-    total_minutes = sum(game.playtime_forever for game in games)
+    # Filter the played games once; totals and rankings all work off it.
+    # Recent playtime is part of all-time playtime, so only played games
+    # can have any.
+    played_games = [game for game in games if game.playtime_forever > 0]
+    games_with_playtime = len(played_games)
+    total_minutes = sum(map(_by_playtime_forever, played_games))
     total_hours = minutes_to_hours(total_minutes)
     
-    # Count games with actual playtime
-    games_with_playtime = len([game for game in games if game.playtime_forever > 0])
-    
-    # Get top games by all-time playtime (exclude games with 0 playtime)
-    played_games = [game for game in games if game.playtime_forever > 0]
-    top_alltime_games = sorted(played_games, key=lambda x: x.playtime_forever, reverse=True)[:3]
-    top_alltime = [(game.name, minutes_to_hours(game.playtime_forever)) for game in top_alltime_games]
+    # Bounded-heap selection of the top 3; ties keep library order
+    top_alltime_games = heapq.nlargest(3, played_games, key=_by_playtime_forever)
+    top_alltime = [(game.name, game.playtime_forever) for game in top_alltime_games]
     
-    # Get top games by recent playtime (past 2 weeks)
-    recent_games = [game for game in games if game.playtime_2weeks > 0]
-    top_recent_games = sorted(recent_games, key=lambda x: x.playtime_2weeks, reverse=True)[:3]
-    top_recent = [(game.name, minutes_to_hours(game.playtime_2weeks)) for game in top_recent_games]
+    recent_games = [game for game in played_games if game.playtime_2weeks > 0]
+    top_recent_games = heapq.nlargest(3, recent_games, key=_by_playtime_2weeks)
+    top_recent = [(game.name, game.playtime_2weeks) for game in top_recent_games]
     
     return PlaytimeStatistics(
         total_hours=total_hours,
+        total_minutes=total_minutes,
         total_games=len(games),
         games_with_playtime=games_with_playtime,
         top_alltime=top_alltime,
@@ -100,29 +173,56 @@ def merge_owned_and_recent_data(owned_games: List[GameData],
     # Create a lookup dict for recent games by appid
     recent_lookup = {game.appid: game for game in recent_games}
     
-    # Update owned games with recent playtime data if available
+    # Update owned games with recent playtime data if available, only
+    # allocating a new GameData when the recent entry actually changes it
     merged_games = []
+    append = merged_games.append
+    recent_get = recent_lookup.get
     for game in owned_games:
-        if game.appid in recent_lookup:
-            recent_game = recent_lookup[game.appid]
-            # Use the recent game's 2-week playtime data
-            updated_game = GameData(
-                appid=game.appid,
-                name=game.name,
-                playtime_forever=max(game.playtime_forever, recent_game.playtime_forever),
-                playtime_2weeks=recent_game.playtime_2weeks,
-                img_icon_url=game.img_icon_url or recent_game.img_icon_url,
-                img_logo_url=game.img_logo_url or recent_game.img_logo_url
-            )
-            merged_games.append(updated_game)
-        else:
-            merged_games.append(game)
+        recent_game = recent_get(game.appid)
+        if recent_game is None:
+            append(game)
+            continue
+        
+        playtime_forever = max(game.playtime_forever, recent_game.playtime_forever)
+        img_icon_url = game.img_icon_url or recent_game.img_icon_url
+        img_logo_url = game.img_logo_url or recent_game.img_logo_url
+        
+        if (playtime_forever == game.playtime_forever
+                and recent_game.playtime_2weeks == game.playtime_2weeks
+                and img_icon_url == game.img_icon_url
+                and img_logo_url == game.img_logo_url):
+            append(game)
+            continue
+        
+        # Use the recent game's 2-week playtime data
+        append(replace(
+            game,
+            playtime_forever=playtime_forever,
+            playtime_2weeks=recent_game.playtime_2weeks,
+            img_icon_url=img_icon_url,
+            img_logo_url=img_logo_url
+        ))
     
     return merged_games
 
 
+def build_name_index(games: List[GameData]) -> List[str]:
+    """
+    Build a lowercased name index for repeated searches over the same games.
+    
+    Args:
+        games: List of GameData objects
+        
+    Returns:
+        Lowercased game names, in the same order as games
+    """
+    return [game.name.lower() for game in games]
+
+
 def find_games_by_criteria(games: List[GameData], min_hours: float = None, 
-                          max_hours: float = None, name_contains: str = None) -> List[GameData]:
+                          max_hours: float = None, name_contains: str = None,
+                          names_lower: Optional[List[str]] = None) -> List[GameData]:
     """
     Find games matching specific criteria.
     
@@ -131,25 +231,29 @@ def find_games_by_criteria(games: List[GameData], min_hours: float = None,
         min_hours: Minimum playtime in hours (optional)
         max_hours: Maximum playtime in hours (optional)
         name_contains: Game name must contain this string (case-insensitive, optional)
+        names_lower: Index from build_name_index(games), reused across calls
+            to avoid lowercasing every name on each search (optional)
         
     Returns:
         Filtered list of GameData objects
     """
-    filtered_games = games
+    # Resolve all criteria up front so each game is checked in a single pass
+    min_minutes = int(min_hours * 60) if min_hours is not None else float('-inf')
+    max_minutes = int(max_hours * 60) if max_hours is not None else float('inf')
     
-    if min_hours is not None:
-        min_minutes = int(min_hours * 60)
-        filtered_games = [game for game in filtered_games if game.playtime_forever >= min_minutes]
+    if name_contains is None:
+        return [game for game in games
+                if min_minutes <= game.playtime_forever <= max_minutes]
     
-    if max_hours is not None:
-        max_minutes = int(max_hours * 60)
-        filtered_games = [game for game in filtered_games if game.playtime_forever <= max_minutes]
+    search_term = name_contains.lower()
+    if names_lower is not None:
+        return [game for game, name in zip(games, names_lower)
+                if min_minutes <= game.playtime_forever <= max_minutes
+                and search_term in name]
     
-    if name_contains is not None:
-        search_term = name_contains.lower()
-        filtered_games = [game for game in filtered_games if search_term in game.name.lower()]
-    
-    return filtered_games
+    return [game for game in games
+            if min_minutes <= game.playtime_forever <= max_minutes
+            and search_term in game.name.lower()]
 
 
 def get_playtime_breakdown(games: List[GameData]) -> Dict[str, Any]:
@@ -180,56 +284,49 @@ def get_playtime_breakdown(games: List[GameData]) -> Dict[str, Any]:
             }
         }
     
+    # Sort the playtime column once; the played count, median and range
+    # histogram are all read off the sorted list with binary searches
+    playtimes = sorted(game.playtime_forever for game in games)
+    first_played = bisect_right(playtimes, 0)
+    
     # Basic counts
-    total_games = len(games)
-    played_games = [game for game in games if game.playtime_forever > 0]
-    played_count = len(played_games)
-    unplayed_count = total_games - played_count
+    total_games = len(playtimes)
+    played_count = total_games - first_played
+    unplayed_count = first_played
     
     # Total hours
-    total_minutes = sum(game.playtime_forever for game in games)
-    total_hours = minutes_to_hours(total_minutes)
+    total_minutes = sum(playtimes)
+    total_hours = round(total_minutes / 60.0, 1)
     
     # Average hours per played game
     avg_hours = minutes_to_hours(total_minutes / played_count) if played_count > 0 else 0.0
     
-    # Median hours (only for played games)
-    if played_games:
-        sorted_playtimes = sorted([game.playtime_forever for game in played_games])
-        mid = len(sorted_playtimes) // 2
-        if len(sorted_playtimes) % 2 == 0:
-            median_minutes = (sorted_playtimes[mid-1] + sorted_playtimes[mid]) / 2
+    # Median hours (only for played games, which form the tail of the list)
+    if played_count > 0:
+        mid = first_played + played_count // 2
+        if played_count % 2 == 0:
+            median_minutes = (playtimes[mid-1] + playtimes[mid]) / 2
         else:
-            median_minutes = sorted_playtimes[mid]
+            median_minutes = playtimes[mid]
         median_hours = minutes_to_hours(median_minutes)
     else:
         median_hours = 0.0
     
-    # Games by playtime range
+    # Games by playtime range, bounded in minutes (60 = 1h, 600 = 10h,
+    # 3000 = 50h, 6000 = 100h)
+    up_to_1h = bisect_right(playtimes, 60)
+    up_to_10h = bisect_right(playtimes, 600)
+    up_to_50h = bisect_right(playtimes, 3000)
+    up_to_100h = bisect_right(playtimes, 6000)
     ranges = {
-        "0_hours": 0,
-        "0_to_1_hours": 0,
-        "1_to_10_hours": 0,
-        "10_to_50_hours": 0,
-        "50_to_100_hours": 0,
-        "100_plus_hours": 0
+        "0_hours": first_played,
+        "0_to_1_hours": up_to_1h - first_played,
+        "1_to_10_hours": up_to_10h - up_to_1h,
+        "10_to_50_hours": up_to_50h - up_to_10h,
+        "50_to_100_hours": up_to_100h - up_to_50h,
+        "100_plus_hours": total_games - up_to_100h
     }
     
-    for game in games:
-        hours = minutes_to_hours(game.playtime_forever)
-        if hours == 0:
-            ranges["0_hours"] += 1
-        elif hours <= 1:
-            ranges["0_to_1_hours"] += 1
-        elif hours <= 10:
-            ranges["1_to_10_hours"] += 1
-        elif hours <= 50:
-            ranges["10_to_50_hours"] += 1
-        elif hours <= 100:
-            ranges["50_to_100_hours"] += 1
-        else:
-            ranges["100_plus_hours"] += 1
-    
     return {
         "total_games": total_games,
         "played_games": played_count,
@@ -261,12 +358,12 @@ if __name__ == "__main__":
     print(f"Games with playtime: {stats.games_with_playtime}")
     
     print("\nTop 3 all-time:")
-    for i, (name, hours) in enumerate(stats.top_alltime, 1):
-        print(f"  {i}. {name}: {hours:.1f} hours")
+    for i, (name, minutes) in enumerate(stats.top_alltime, 1):
+        print(f"  {i}. {name}: {minutes_to_hours(minutes):.1f} hours")
     
     print("\nTop 3 recent:")
-    for i, (name, hours) in enumerate(stats.top_recent, 1):
-        print(f"  {i}. {name}: {hours:.1f} hours")
+    for i, (name, minutes) in enumerate(stats.top_recent, 1):
+        print(f"  {i}. {name}: {minutes_to_hours(minutes):.1f} hours")
     
     print("\nPlaytime breakdown:")
     breakdown = get_playtime_breakdown(test_games)
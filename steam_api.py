@@ -6,17 +6,35 @@ game library data, playtime statistics, and other account information.
 """
 
 import os
-import sys
 import time
-import json
+import logging
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass
 
+try:
+    # orjson parses the raw response bytes directly and is several times
+    # faster on large owned-games payloads; it is optional
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-@dataclass
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+@dataclass(slots=True, frozen=True)
 class GameData:
-    """Represents game data from Steam API."""
+    """
+    Represents game data from Steam API.
+    
+    Instances are slotted and immutable: libraries can hold thousands of
+    them, and updated copies are made with dataclasses.replace.
+    """
     appid: int
     name: str
     playtime_forever: int  # in minutes
@@ -30,10 +48,96 @@ class SteamAPIError(Exception):
     pass
 
 
+def _games_from_payload(data: Dict[str, Any]) -> List[GameData]:
+    """
+    Build GameData objects from the 'games' list of an API response.
+    
+    Args:
+        data: Response payload from GetOwnedGames or GetRecentlyPlayedGames
+        
+    Returns:
+        List of GameData objects (empty if the payload has no games)
+    """
+    games = data.get('games')
+    if not games:
+        return []
+    
+    # Positional arguments in field order: appid, name, playtime_forever,
+    # playtime_2weeks, img_icon_url, img_logo_url
+    return [
+        GameData(
+            game_data.get('appid', 0),
+            game_data.get('name', 'Unknown Game'),
+            game_data.get('playtime_forever', 0),
+            game_data.get('playtime_2weeks', 0),
+            game_data.get('img_icon_url', ''),
+            game_data.get('img_logo_url', '')
+        )
+        for game_data in games
+    ]
+
+
+class _LoggingRetry(Retry):
+    """urllib3 Retry policy that logs each retry it grants."""
+    
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        # An exhausted policy raises MaxRetryError here, so only retries that
+        # will actually happen reach the log lines below
+        new_retry = super().increment(method, url, response, error, *args, **kwargs)
+        
+        # The URL carries the API key, so it is deliberately not logged
+        if response is not None and response.status == 429:
+            logger.warning("Rate limited by Steam API, retrying (%s retries left)", new_retry.total)
+        elif response is not None:
+            logger.warning("HTTP %d from Steam API, retrying (%s retries left)", response.status, new_retry.total)
+        elif error is not None:
+            logger.warning("Network error: %s, retrying (%s retries left)", error, new_retry.total)
+        return new_retry
+
+
+class BackgroundCall:
+    """
+    Runs a callable on a daemon thread and hands back its result later.
+    
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined at
+    interpreter exit, so a request that is abandoned (an early return or
+    Ctrl+C) never keeps the process alive until it completes.
+    """
+    
+    def __init__(self, func: Callable[[], Any]):
+        self._func = func
+        self._value = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        try:
+            self._value = self._func()
+        except BaseException as e:
+            self._error = e
+    
+    def result(self) -> Any:
+        """
+        Wait for the call to finish and return its result.
+        
+        Raises:
+            Whatever exception the callable raised
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
 class SteamAPIClient:
     """Steam Web API client with error handling and rate limiting."""
     
     BASE_URL = "https://api.steampowered.com"
+    POOL_SIZE = 10  # pooled connections kept open to the API host
+    OWNED_GAMES_URL = f"{BASE_URL}/IPlayerService/GetOwnedGames/v0001/"
+    RECENT_GAMES_URL = f"{BASE_URL}/IPlayerService/GetRecentlyPlayedGames/v0001/"
+    PLAYER_SUMMARY_URL = f"{BASE_URL}/ISteamUser/GetPlayerSummaries/v0002/"
     
     def __init__(self, api_key: str):
         self.api_key = api_key
@@ -42,30 +146,70 @@ class SteamAPIClient:
             'User-Agent': 'Steam-Hours-Tool/1.0'
         })
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.2  # 200ms between requests
+        # Retries with exponential backoff for rate limiting, transient server
+        # errors and network failures, honouring Steam's Retry-After header.
+        # Exhausted status retries return the last response so it can be
+        # mapped to a SteamAPIError in _make_request.
+        retry = _LoggingRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE)
+        self.session.mount('https://', adapter)
+        
+        # Rate limiting: token bucket shared by all threads issuing requests.
+        # Allows short bursts of up to `capacity` requests, then sustains
+        # `refill_rate` requests per second.
+        self.capacity = 5
+        self.refill_rate = 5.0  # tokens per second
+        self.tokens = float(self.capacity)
+        self.last_refill_ns = time.monotonic_ns()
+        self._rate_limit_lock = threading.Lock()
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self) -> 'SteamAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _rate_limit(self):
         """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            # Integer nanoseconds from the monotonic clock: immune to wall
+            # clock adjustments and free of float rounding in the subtraction
+            now_ns = time.monotonic_ns()
+            elapsed_ns = now_ns - self.last_refill_ns
+            self.tokens = min(self.capacity, self.tokens + elapsed_ns * self.refill_rate / 1e9)
+            self.last_refill_ns = now_ns
+            
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            
+            # Wait until one whole token has accrued, then spend it
+            sleep_ns = int((1 - self.tokens) / self.refill_rate * 1e9)
+            time.sleep(sleep_ns / 1e9)
+            self.tokens = 0.0
+            self.last_refill_ns = now_ns + sleep_ns
     
-    def _make_request(self, endpoint: str, params: Dict[str, Any], 
-                     max_retries: int = 3) -> Dict[str, Any]:
+    def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Make a request to the Steam API with error handling and retries.
+        Make a request to the Steam API with error handling.
+        
+        Retries with exponential backoff are handled by the session's
+        transport adapter (see __init__).
         
         Args:
-            endpoint: API endpoint (relative to BASE_URL)
+            url: Full endpoint URL (one of the *_URL class constants)
             params: Request parameters
-            max_retries: Maximum number of retry attempts
             
         Returns:
             JSON response data
@@ -76,52 +220,38 @@ class SteamAPIClient:
         # Add API key to parameters
         params['key'] = self.api_key
         
-        url = f"{self.BASE_URL}/{endpoint}"
+        self._rate_limit()
         
-        for attempt in range(max_retries + 1):
-            try:
-                self._rate_limit()
-                
-                response = self.session.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Check for Steam API-specific errors
-                if 'response' not in data:
-                    raise SteamAPIError(f"Invalid API response format: {data}")
-                
-                return data['response']
-                
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 429:  # Rate limited
-                    if attempt < max_retries:
-                        wait_time = (2 ** attempt) * 1.0  # Exponential backoff
-                        print(f"Rate limited, waiting {wait_time:.1f}s before retry...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise SteamAPIError("Rate limit exceeded. Please try again later.")
-                elif response.status_code == 401:
-                    raise SteamAPIError("Invalid API key. Please check your Steam Web API key.")
-                elif response.status_code == 403:
-                    raise SteamAPIError("Access forbidden. Check API key permissions or account privacy settings.")
-                else:
-                    raise SteamAPIError(f"HTTP error {response.status_code}: {e}")
+        try:
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
             
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = (2 ** attempt) * 1.0
-                    print(f"Network error, retrying in {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    raise SteamAPIError(f"Network error: {e}")
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError; the stdlib
+            # fallback raises UnicodeDecodeError for bodies that aren't valid
+            # UTF-8/16/32 (both are ValueErrors, caught below)
+            data = json_loads(response.content)
             
-            except json.JSONDecodeError as e:
-                raise SteamAPIError(f"Invalid JSON response: {e}")
+        except requests.exceptions.HTTPError as e:
+            if response.status_code == 429:  # Still rate limited after retries
+                raise SteamAPIError("Rate limit exceeded. Please try again later.")
+            elif response.status_code == 401:
+                raise SteamAPIError("Invalid API key. Please check your Steam Web API key.")
+            elif response.status_code == 403:
+                raise SteamAPIError("Access forbidden. Check API key permissions or account privacy settings.")
+            else:
+                raise SteamAPIError(f"HTTP error {response.status_code}: {e}")
+        
+        except requests.exceptions.RequestException as e:
+            raise SteamAPIError(f"Network error: {e}")
         
-        raise SteamAPIError(f"Max retries ({max_retries}) exceeded")
+        except ValueError as e:
+            raise SteamAPIError(f"Invalid JSON response: {e}")
+        
+        # Check for Steam API-specific errors
+        if 'response' not in data:
+            raise SteamAPIError(f"Invalid API response format: {data}")
+        
+        return data['response']
     
     def get_owned_games(self, steam_id: str) -> List[GameData]:
         """
@@ -144,27 +274,12 @@ class SteamAPIClient:
         }
         
         try:
-            data = self._make_request('IPlayerService/GetOwnedGames/v0001/', params)
+            data = self._make_request(self.OWNED_GAMES_URL, params)
         except SteamAPIError as e:
             raise SteamAPIError(f"Failed to fetch owned games: {e}")
         
-        if 'games' not in data:
-            # User might have no games or private profile
-            return []
-        
-        games = []
-        for game_data in data['games']:
-            game = GameData(
-                appid=game_data.get('appid', 0),
-                name=game_data.get('name', 'Unknown Game'),
-                playtime_forever=game_data.get('playtime_forever', 0),
-                playtime_2weeks=game_data.get('playtime_2weeks', 0),
-                img_icon_url=game_data.get('img_icon_url', ''),
-                img_logo_url=game_data.get('img_logo_url', '')
-            )
-            games.append(game)
-        
-        return games
+        # An empty result means the user has no games or a private profile
+        return _games_from_payload(data)
     
     def get_recently_played_games(self, steam_id: str) -> List[GameData]:
         """
@@ -186,26 +301,11 @@ class SteamAPIClient:
         }
         
         try:
-            data = self._make_request('IPlayerService/GetRecentlyPlayedGames/v0001/', params)
+            data = self._make_request(self.RECENT_GAMES_URL, params)
         except SteamAPIError as e:
             raise SteamAPIError(f"Failed to fetch recently played games: {e}")
         
-        if 'games' not in data:
-            return []
-        
-        games = []
-        for game_data in data['games']:
-            game = GameData(
-                appid=game_data.get('appid', 0),
-                name=game_data.get('name', 'Unknown Game'),
-                playtime_forever=game_data.get('playtime_forever', 0),
-                playtime_2weeks=game_data.get('playtime_2weeks', 0),
-                img_icon_url=game_data.get('img_icon_url', ''),
-                img_logo_url=game_data.get('img_logo_url', '')
-            )
-            games.append(game)
-        
-        return games
+        return _games_from_payload(data)
     
     def get_player_summary(self, steam_id: str) -> Dict[str, Any]:
         """
@@ -226,7 +326,7 @@ class SteamAPIClient:
         }
         
         try:
-            data = self._make_request('ISteamUser/GetPlayerSummaries/v0002/', params)
+            data = self._make_request(self.PLAYER_SUMMARY_URL, params)
         except SteamAPIError as e:
             raise SteamAPIError(f"Failed to fetch player summary: {e}")
         
@@ -234,17 +334,100 @@ class SteamAPIClient:
             raise SteamAPIError("Player not found or profile is private")
         
         return data['players'][0]
+    
+    def start_games_fetch(self, steam_id: str,
+                          fetch_owned: Optional[Callable[[], List[GameData]]] = None,
+                          fetch_recent: Optional[Callable[[], List[GameData]]] = None
+                          ) -> Tuple[BackgroundCall, BackgroundCall]:
+        """
+        Start fetching owned and recently played games in the background.
+        
+        The two endpoints are independent, so their round trips overlap
+        instead of waiting on each other. The client's rate limiting still
+        applies.
+        
+        Args:
+            steam_id: Steam 64-bit ID
+            fetch_owned: Callable used instead of get_owned_games(steam_id),
+                e.g. one that consults a cache first (optional)
+            fetch_recent: Callable used instead of
+                get_recently_played_games(steam_id) (optional)
+            
+        Returns:
+            Tuple of (owned games, recently played games) BackgroundCalls;
+            their result() raises SteamAPIError if the request failed
+        """
+        if fetch_owned is None:
+            fetch_owned = lambda: self.get_owned_games(steam_id)
+        if fetch_recent is None:
+            fetch_recent = lambda: self.get_recently_played_games(steam_id)
+        return BackgroundCall(fetch_owned), BackgroundCall(fetch_recent)
+    
+    def fetch_all(self, steam_id: str) -> Tuple[Dict[str, Any], List[GameData], List[GameData]]:
+        """
+        Fetch player summary, owned games and recently played games.
+        
+        The player summary is fetched first, so an invalid key or missing
+        profile fails without issuing the game requests; the two game
+        requests then run concurrently (see start_games_fetch).
+        
+        Args:
+            steam_id: Steam 64-bit ID
+            
+        Returns:
+            Tuple of (player summary, owned games, recently played games)
+            
+        Raises:
+            SteamAPIError: If any of the API requests fails
+        """
+        summary = self.get_player_summary(steam_id)
+        owned_games, recent_games = self.start_games_fetch(steam_id)
+        return summary, owned_games.result(), recent_games.result()
+    
+    def fetch_many(self, steam_ids: List[str], max_workers: int = POOL_SIZE // 2
+                   ) -> Dict[str, Tuple[Dict[str, Any], List[GameData], List[GameData]]]:
+        """
+        Fetch player summary, owned games and recently played games for several users.
+        
+        Up to max_workers users are fetched at once. Each user has up to two
+        requests in flight (see fetch_all), so max_workers is capped at half
+        the connection pool size. Every request draws from the client's
+        shared token bucket, so the overall request rate stays within the
+        limit however many users are queried. The first failure cancels the
+        users that haven't started yet.
+        
+        Args:
+            steam_ids: Steam 64-bit IDs
+            max_workers: Maximum number of users fetched concurrently
+            
+        Returns:
+            Dict mapping each Steam ID to its (player summary, owned games,
+            recently played games) tuple
+            
+        Raises:
+            SteamAPIError: If any of the API requests fails
+        """
+        if not steam_ids:
+            return {}
+        
+        workers = max(1, min(max_workers, self.POOL_SIZE // 2, len(steam_ids)))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(self.fetch_all, steam_id) for steam_id in steam_ids]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            # Raises the first failure, if any, before the rest are fetched
+            return {steam_id: future.result() for steam_id, future in zip(steam_ids, futures)}
+        finally:
+            # Drop queued users on failure; only in-flight ones are waited for
+            pool.shutdown(cancel_futures=True)
 
 
-def get_api_key() -> str:
+def get_api_key() -> Optional[str]:
     """
     Get Steam Web API key from environment variable or user input.
     
     Returns:
-        Steam Web API key
-        
-    Raises:
-        SystemExit: If no API key is provided
+        Steam Web API key, or None if no API key is provided
     """
     # Check environment variable first
     api_key = os.environ.get('STEAM_API_KEY')
@@ -253,14 +436,13 @@ def get_api_key() -> str:
     
     # Check for stored API key file
     api_key_file = os.path.expandvars(r'%APPDATA%\steam-hours-tool\apikey.txt')
-    if os.path.exists(api_key_file):
-        try:
-            with open(api_key_file, 'r') as f:
-                stored_key = f.read().strip()
-                if stored_key:
-                    return stored_key
-        except Exception:
-            pass
+    try:
+        with open(api_key_file, 'r', encoding='utf-8') as f:
+            stored_key = f.read().strip()
+            if stored_key:
+                return stored_key
+    except (OSError, UnicodeDecodeError):
+        pass  # Missing or unreadable: ask for the key below
     
     # Prompt user for API key
     print("🔑 Steam Web API Key Required")
@@ -278,7 +460,7 @@ def get_api_key() -> str:
     
     if not api_key:
         print("❌ Error: No API key provided.")
-        sys.exit(1)
+        return None
     
     # Store the API key for future use
     try:
@@ -294,27 +476,24 @@ def get_api_key() -> str:
 
 if __name__ == "__main__":
     # Test the Steam API client
-    try:
-        api_key = get_api_key()
-        client = SteamAPIClient(api_key)
-        
-        # Test with a public Steam ID (replace with actual ID for testing)
-        test_steam_id = "76561199469631140"  # Darnix's ID from VDF
-        
-        print(f"Testing Steam API with Steam ID: {test_steam_id}")
-        
-        try:
-            summary = client.get_player_summary(test_steam_id)
-            print(f"Player: {summary.get('personaname', 'Unknown')}")
-            
-            games = client.get_owned_games(test_steam_id)
-            print(f"Total games: {len(games)}")
+    api_key = get_api_key()
+    if api_key:
+        with SteamAPIClient(api_key) as client:
             
-            recent_games = client.get_recently_played_games(test_steam_id)
-            print(f"Recently played games: {len(recent_games)}")
+            # Test with a public Steam ID (replace with actual ID for testing)
+            test_steam_id = "76561199469631140"  # Darnix's ID from VDF
             
-        except SteamAPIError as e:
-            print(f"❌ API Error: {e}")
+            print(f"Testing Steam API with Steam ID: {test_steam_id}")
             
-    except SystemExit:
-        pass
\ No newline at end of file
+            try:
+                summary = client.get_player_summary(test_steam_id)
+                print(f"Player: {summary.get('personaname', 'Unknown')}")
+                
+                games = client.get_owned_games(test_steam_id)
+                print(f"Total games: {len(games)}")
+                
+                recent_games = client.get_recently_played_games(test_steam_id)
+                print(f"Recently played games: {len(recent_games)}")
+                
+            except SteamAPIError as e:
+                print(f"❌ API Error: {e}")
\ No newline at end of file
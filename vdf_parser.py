@@ -6,22 +6,42 @@ Steam account information from the loginusers.vdf configuration file.
 """
 
 import os
-import sys
+import re
+import functools
+from operator import attrgetter
 import vdf
 import winreg
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+
+# loginusers.vdf is a flat "users" block of "<steamid64>" { "Key" "Value" ... }
+# entries, so a regex pass can pull out the accounts without the generic parser
+_ACCOUNT_RE = re.compile(r'"(\d{17})"\s*\{([^{}]*)\}')
+_FIELD_RE = re.compile(r'"((?:\\.|[^\\"])*)"[ \t]+"((?:\\.|[^\\"])*)"')
+
+# Same escape sequences the vdf package unescapes
+_ESCAPE_RE = re.compile(r'\\[ntvbrfa\\?"\']')
+_ESCAPES = {
+    '\\n': '\n', '\\t': '\t', '\\v': '\v', '\\b': '\b', '\\r': '\r',
+    '\\f': '\f', '\\a': '\a', '\\\\': '\\', '\\?': '?', '\\"': '"', "\\'": "'",
+}
 
 
 class SteamAccount:
     """Represents a Steam account with its configuration data."""
     
+    __slots__ = ('steam_id', 'account_name', 'persona_name', 'most_recent', 'timestamp', '_sort_key')
+    
     def __init__(self, steam_id: str, account_name: str, persona_name: str, 
-                 most_recent: bool, timestamp: str):
+                 most_recent: bool, timestamp: int):
         self.steam_id = steam_id
         self.account_name = account_name
         self.persona_name = persona_name
         self.most_recent = most_recent
-        self.timestamp = int(timestamp)
+        self.timestamp = timestamp
+        # Most recent account first, then newest first, packed into a single
+        # integer so sorting compares plain ints instead of tuples
+        self._sort_key = (0 if most_recent else 1) << 64 | (0xFFFFFFFFFFFFFFFF - self.timestamp)
     
     def __str__(self):
         status = " (Most Recent)" if self.most_recent else ""
@@ -31,21 +51,37 @@ class SteamAccount:
         return f"SteamAccount(steam_id='{self.steam_id}', account_name='{self.account_name}', persona_name='{self.persona_name}', most_recent={self.most_recent})"
 
 
+_by_sort_key = attrgetter('_sort_key')
+
+
+# Registry values that record the Steam directory, most reliable first
+_STEAM_REGISTRY_KEYS = (
+    (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath"),
+    (winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam", "SteamPath"),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def find_steam_path() -> Optional[str]:
     """
     Find Steam installation path by checking registry and common locations.
     
+    The result is cached for the life of the process; call
+    invalidate_steam_path_cache() to look it up again.
+    
     Returns:
         Path to Steam installation directory, or None if not found.
     """
     # Try registry first (most reliable)
-    try:
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam") as key:
-            install_path, _ = winreg.QueryValueEx(key, "InstallPath")
-            if os.path.exists(install_path):
-                return install_path
-    except (OSError, FileNotFoundError):
-        pass
+    for hive, subkey, value_name in _STEAM_REGISTRY_KEYS:
+        try:
+            with winreg.OpenKey(hive, subkey) as key:
+                install_path, _ = winreg.QueryValueEx(key, value_name)
+        except OSError:
+            continue
+        install_path = os.path.normpath(install_path)
+        if os.path.exists(install_path):
+            return install_path
     
     # Fallback to common installation paths
     common_paths = [
@@ -61,41 +97,85 @@ def find_steam_path() -> Optional[str]:
     return None
 
 
+def invalidate_steam_path_cache():
+    """Forget the cached Steam installation path."""
+    find_steam_path.cache_clear()
+
+
 def find_loginusers_vdf() -> Optional[str]:
     """
     Locate the Steam loginusers.vdf configuration file.
     
+    The file itself isn't checked here; parse_loginusers_vdf() raises
+    FileNotFoundError if it is missing.
+    
     Returns:
-        Full path to loginusers.vdf file, or None if not found.
+        Full path to loginusers.vdf file, or None if Steam wasn't found.
     """
     steam_path = find_steam_path()
     if not steam_path:
         return None
     
-    loginusers_path = os.path.join(steam_path, "config", "loginusers.vdf")
-    return loginusers_path if os.path.exists(loginusers_path) else None
+    return os.path.join(steam_path, "config", "loginusers.vdf")
 
 
-def parse_loginusers_vdf(vdf_path: str) -> List[SteamAccount]:
+def _unescape(value: str) -> str:
+    """Resolve VDF backslash escapes in a quoted string."""
+    if '\\' not in value:
+        return value
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], value)
+
+
+def _fast_parse_loginusers(text: str) -> Optional[List[SteamAccount]]:
     """
-    Parse the Steam loginusers.vdf file to extract account information.
+    Extract accounts from loginusers.vdf text with a single regex pass.
     
     Args:
-        vdf_path: Full path to the loginusers.vdf file
+        text: Contents of the loginusers.vdf file
         
     Returns:
-        List of SteamAccount objects sorted by most recent first
+        List of SteamAccount objects (unsorted), or None if the text doesn't
+        have the expected flat layout and needs the full VDF parser
+    """
+    matches = _ACCOUNT_RE.findall(text)
+    
+    # One brace pair for "users" and one per account; anything else (nested
+    # blocks, braces inside names) is left to the vdf package. Both kinds are
+    # counted because a lone '}' in a name would otherwise end the account
+    # body early and silently drop its remaining fields.
+    expected = len(matches) + 1
+    if not matches or text.count('{') != expected or text.count('}') != expected:
+        return None
+    
+    accounts = []
+    for steam_id, body in matches:
+        g = {key: _unescape(value) for key, value in _FIELD_RE.findall(body)}.get
+        accounts.append(SteamAccount(
+            steam_id=steam_id,
+            account_name=g('AccountName', 'Unknown'),
+            persona_name=g('PersonaName', 'Unknown'),
+            most_recent=g('MostRecent') == '1',
+            timestamp=int(g('Timestamp', '0'))
+        ))
+    
+    return accounts
+
+
+def _parse_with_vdf(text: str) -> List[SteamAccount]:
+    """
+    Extract accounts from loginusers.vdf text using the vdf package.
+    
+    Args:
+        text: Contents of the loginusers.vdf file
+        
+    Returns:
+        List of SteamAccount objects (unsorted)
         
     Raises:
-        FileNotFoundError: If the VDF file doesn't exist
-        ValueError: If the VDF file is corrupted or has unexpected format
+        ValueError: If the VDF text is corrupted or has unexpected format
     """
-    if not os.path.exists(vdf_path):
-        raise FileNotFoundError(f"Steam loginusers.vdf not found at: {vdf_path}")
-    
     try:
-        with open(vdf_path, 'r', encoding='utf-8') as file:
-            data = vdf.load(file)
+        data = vdf.loads(text)
     except Exception as e:
         raise ValueError(f"Failed to parse VDF file: {e}")
     
@@ -106,65 +186,151 @@ def parse_loginusers_vdf(vdf_path: str) -> List[SteamAccount]:
     users = data['users']
     
     for steam_id, user_data in users.items():
+        g = user_data.get
         try:
             account = SteamAccount(
                 steam_id=steam_id,
-                account_name=user_data.get('AccountName', 'Unknown'),
-                persona_name=user_data.get('PersonaName', 'Unknown'),
-                most_recent=user_data.get('MostRecent', '0') == '1',
-                timestamp=user_data.get('Timestamp', '0')
+                account_name=g('AccountName', 'Unknown'),
+                persona_name=g('PersonaName', 'Unknown'),
+                most_recent=g('MostRecent') == '1',
+                timestamp=int(g('Timestamp', '0'))
             )
             accounts.append(account)
         except KeyError as e:
             print(f"Warning: Skipping incomplete account entry for {steam_id}: missing {e}")
             continue
     
+    return accounts
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_by_key(vdf_path: str, mtime_ns: int, size: int) -> Tuple[SteamAccount, ...]:
+    """
+    Read and parse loginusers.vdf, memoized on the file's stat signature.
+    
+    mtime_ns and size only take part in the cache key: any write by Steam
+    changes them, so a stale parse is never returned.
+    
+    Args:
+        vdf_path: Full path to the loginusers.vdf file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Tuple of SteamAccount objects sorted by most recent first
+        
+    Raises:
+        FileNotFoundError: If the VDF file doesn't exist
+        ValueError: If the VDF file is corrupted or has unexpected format
+    """
+    # Read the raw bytes and decode them in one go rather than through a
+    # text-mode file; undecodable bytes in names shouldn't reject the file
+    try:
+        with open(vdf_path, 'rb') as file:
+            text = file.read().decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Steam loginusers.vdf not found at: {vdf_path}") from None
+    except OSError as e:
+        raise ValueError(f"Failed to parse VDF file: {e}")
+    
+    accounts = _fast_parse_loginusers(text)
+    if accounts is None:
+        accounts = _parse_with_vdf(text)
+    
     # Sort by most recent first, then by timestamp (newest first)
-    accounts.sort(key=lambda x: (not x.most_recent, -x.timestamp))
+    accounts.sort(key=_by_sort_key)
     
-    return accounts
+    return tuple(accounts)
 
 
-def get_steam_accounts() -> List[SteamAccount]:
+def parse_loginusers_vdf(vdf_path: str) -> List[SteamAccount]:
     """
-    Get all Steam accounts from the system.
+    Parse the Steam loginusers.vdf file to extract account information.
     
+    Repeated calls reuse the previous parse until the file changes.
+    
+    Args:
+        vdf_path: Full path to the loginusers.vdf file
+        
     Returns:
-        List of SteamAccount objects
+        List of SteamAccount objects sorted by most recent first
         
     Raises:
-        SystemExit: If Steam is not found or VDF file cannot be parsed
+        FileNotFoundError: If the VDF file doesn't exist
+        ValueError: If the VDF file is corrupted or has unexpected format
+    """
+    try:
+        stat = os.stat(vdf_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Steam loginusers.vdf not found at: {vdf_path}") from None
+    except OSError as e:
+        raise ValueError(f"Failed to parse VDF file: {e}")
+    
+    # A fresh list each call so callers can't alter the cached result
+    return list(_parse_by_key(vdf_path, stat.st_mtime_ns, stat.st_size))
+
+
+def _print_steam_not_found():
+    """Print the troubleshooting steps for a missing Steam installation."""
+    print("❌ Error: Could not locate Steam installation or loginusers.vdf file.")
+    print("\nTroubleshooting:")
+    print("1. Make sure Steam is installed")
+    print("2. Try running Steam at least once to generate the configuration")
+    print("3. Check if Steam is installed in a non-standard location")
+
+
+def get_steam_accounts() -> Optional[List[SteamAccount]]:
+    """
+    Get all Steam accounts from the system.
+    
+    Returns:
+        List of SteamAccount objects, or None if Steam is not found, the VDF
+        file cannot be parsed or it contains no accounts (the reason has
+        already been printed)
     """
     vdf_path = find_loginusers_vdf()
     
     if not vdf_path:
-        print("❌ Error: Could not locate Steam installation or loginusers.vdf file.")
-        print("\nTroubleshooting:")
-        print("1. Make sure Steam is installed")
-        print("2. Try running Steam at least once to generate the configuration")
-        print("3. Check if Steam is installed in a non-standard location")
-        sys.exit(1)
+        _print_steam_not_found()
+        return None
     
     try:
         accounts = parse_loginusers_vdf(vdf_path)
-        if not accounts:
-            print("❌ Error: No Steam accounts found in configuration.")
-            print("Please log into Steam at least once to create account data.")
-            sys.exit(1)
-        
-        return accounts
-    
-    except (FileNotFoundError, ValueError) as e:
+    except FileNotFoundError:
+        _print_steam_not_found()
+        return None
+    except ValueError as e:
         print(f"❌ Error: {e}")
-        sys.exit(1)
+        return None
+    
+    if not accounts:
+        print("❌ Error: No Steam accounts found in configuration.")
+        print("Please log into Steam at least once to create account data.")
+        return None
+    
+    return accounts
 
 
 if __name__ == "__main__":
-    # Test the module
-    try:
-        accounts = get_steam_accounts()
+    # Test the module: the regex fast path must agree with the vdf package,
+    # including escaped names and names with braces (which force the fallback)
+    for persona in ('Plain', 'a{b', 'a}b', 'say \\"hi\\"'):
+        sample = (
+            '"users"\n{\n\t"76561198000000001"\n\t{\n'
+            '\t\t"AccountName"\t\t"alice"\n'
+            f'\t\t"PersonaName"\t\t"{persona}"\n'
+            '\t\t"MostRecent"\t\t"1"\n'
+            '\t\t"Timestamp"\t\t"1700000000"\n'
+            '\t}\n}\n'
+        )
+        fast = _fast_parse_loginusers(sample) or _parse_with_vdf(sample)
+        full = _parse_with_vdf(sample)
+        assert [repr(a) for a in fast] == [repr(a) for a in full], persona
+        assert fast[0].timestamp == full[0].timestamp == 1700000000, persona
+    print("VDF parser self-test passed")
+    
+    accounts = get_steam_accounts()
+    if accounts:
         print(f"Found {len(accounts)} Steam account(s):")
         for i, account in enumerate(accounts, 1):
-            print(f"  {i}. {account}")
-    except SystemExit:
-        pass
\ No newline at end of file
+            print(f"  {i}. {account}")
\ No newline at end of file